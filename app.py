@@ -14,19 +14,32 @@ Requirements:
   - Set environment variables (see .env.example and README.md).
   - Install dependencies from requirements.txt.
 
+Running:
+  - Development: python app.py (set FLASK_DEBUG=1 for the debugger/reloader).
+  - Production: gunicorn -k gthread --workers 2 --threads 8 --keep-alive 5 app:app
+
 Notes:
   - Twilio trial accounts can only send SMS to verified recipient numbers.
   - All variable names are descriptive; code includes comments explaining key features.
 """
 import os
-import json
+import atexit
+import queue
 import random
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, List, Tuple
 
 import requests  # For calling external APIs
+from cachetools import TTLCache, cached  # Short-lived cache for weather lookups
+import orjson  # Fast JSON parsing of API responses and serializing of log records
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 from flask import Flask, render_template, request, redirect, url_for, flash
 from twilio.rest import Client  # Twilio SDK for sending SMS
+from twilio.http.http_client import TwilioHttpClient
 from dotenv import load_dotenv  # Load .env locally (Replit can also use Secrets)
 
 # Load environment variables from .env (helpful if running locally).
@@ -50,24 +63,220 @@ TWILIO_AUTH_TOKEN = os.environ.get('TWILIO_AUTH_TOKEN', '')
 TWILIO_FROM_NUMBER = os.environ.get('TWILIO_FROM_NUMBER', '')
 TWILIO_TO_NUMBER = os.environ.get('TWILIO_TO_NUMBER', '')  # Must be verified for trial accounts
 
+# Create the Twilio client once so its pooled HTTP connection is reused
+# for every SMS instead of doing a fresh TLS handshake per request.
+# An explicit timeout keeps a hung Twilio call from holding a background
+# send worker (and blocking shutdown) forever.
+TWILIO_TIMEOUT_SECONDS = 15
+TWILIO_CLIENT = (
+    Client(
+        TWILIO_ACCOUNT_SID,
+        TWILIO_AUTH_TOKEN,
+        http_client=TwilioHttpClient(timeout=TWILIO_TIMEOUT_SECONDS)
+    )
+    if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN else None
+)
+# Env vars are read once, so whether Twilio is fully configured is fixed too.
+_TWILIO_READY = bool(TWILIO_CLIENT is not None and TWILIO_FROM_NUMBER and TWILIO_TO_NUMBER)
+
+# Expected number of requests handled at once by one process (e.g. gunicorn --threads).
+MAX_CONCURRENT_REQUESTS = int(os.environ.get('MAX_CONCURRENT_REQUESTS', '8'))
+
 LOG_FILE_PATH = os.path.join('logs', 'messages.log')
 
+# SMS body template, with unit labels resolved once since WEATHER_UNITS is
+# fixed for the life of the process.
+TEMP_UNIT, WIND_UNIT = ('°C', 'm/s') if WEATHER_UNITS == 'metric' else ('°F', 'mph')
+_MSG_TEMPLATE = (
+    "Weather in {city}: {temp}" + TEMP_UNIT + ", "
+    "feels like {feels_like}" + TEMP_UNIT + ", "
+    "{description}, humidity {humidity}%, "
+    "wind {wind_speed} " + WIND_UNIT + "."
+    " Wizarding note: {name} (House: {house}, Patronus: {patronus})."
+    " People in space right now: {count}{astro_suffix}."
+)
+
+# Log lines are queued and written by one background thread through a
+# single buffered file handle, instead of open/write/close per record.
+# Registered with atexit before the executors below so that pending sends
+# finish (and log) before the writer is drained and closed.
+_LOG_STOP = object()
+_ORJSON_LOG_OPTIONS = orjson.OPT_APPEND_NEWLINE
+LOG_QUEUE: "queue.Queue[Any]" = queue.Queue()
+os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
+_LOG_FILE = open(LOG_FILE_PATH, 'ab', buffering=1 << 16)
+
+def _log_writer_loop() -> None:
+    """
+    Write queued log lines in batches: block for one line, then drain
+    whatever else is already queued and hand it to the file in one write.
+    Write errors are reported via app.logger and do not stop the loop.
+    """
+    stopping = False
+    while not stopping:
+        batch = [LOG_QUEUE.get()]
+        while True:
+            try:
+                batch.append(LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        if _LOG_STOP in batch:
+            stopping = True
+            batch = [line for line in batch if line is not _LOG_STOP]
+        try:
+            if batch:
+                _LOG_FILE.write(b"".join(batch))
+            _LOG_FILE.flush()
+        except OSError as exc:
+            # Disk full, EIO, etc.: report it and keep draining so the
+            # thread stays alive and later records still get a chance.
+            app.logger.error("json-log-writer: failed to write %d record(s): %s", len(batch), exc)
+
+_LOG_WRITER = threading.Thread(target=_log_writer_loop, name='json-log-writer', daemon=True)
+_LOG_WRITER.start()
+
+def _stop_log_writer() -> None:
+    """Drain the log queue and close the log file on shutdown."""
+    LOG_QUEUE.put(_LOG_STOP)
+    _LOG_WRITER.join()
+    _LOG_FILE.close()
+
+atexit.register(_stop_log_writer)
+
+# Thread pool used to call the three external APIs concurrently.
+# The calls are I/O-bound, so threads overlap the network waits. Each fetch
+# can hold a worker for up to API_TIMEOUT, so the pool is sized for three
+# fetches per concurrent request; otherwise requests would queue behind
+# each other's network waits.
+FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=3 * MAX_CONCURRENT_REQUESTS)
+
+# Thread pool for sending the SMS and logging the result in the background,
+# so the user is redirected without waiting on Twilio. Drained on shutdown.
+SMS_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+atexit.register(FETCH_EXECUTOR.shutdown)
+atexit.register(SMS_EXECUTOR.shutdown)
+
+# Shared HTTP session so DNS, TCP and TLS setup are reused across calls
+# and across button presses. Idempotent GETs are retried on gateway errors.
+SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    # read=False: a read timeout is raised as-is rather than retried, so it
+    # surfaces as requests.Timeout and the slow API is not waited on again.
+    # connect=0: connect errors are not retried either, so an unreachable
+    # host fails after a single connect timeout (API_TIMEOUT[0]).
+    max_retries=Retry(total=2, connect=0, read=False, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+SESSION.mount('https://', _HTTP_ADAPTER)
+SESSION.mount('http://', _HTTP_ADAPTER)
+SESSION.headers.update({'Accept-Encoding': 'gzip', 'User-Agent': 'flask-sms-api/1.0'})
+# (connect, read) timeouts in seconds: fail fast on unreachable hosts while
+# still giving slow servers a few seconds to answer.
+API_TIMEOUT = (2.0, 5.0)
+
+# Placeholders used when an API times out, so a partial SMS can still be sent.
+HP_FALLBACK = {
+    'name': 'Unknown Wizard',
+    'house': 'Unknown House',
+    'patronus': 'Unknown Patronus',
+    'actor': 'Unknown Actor'
+}
+WEATHER_FALLBACK = {
+    'description': 'unavailable',
+    'temp': 'N/A',
+    'feels_like': 'N/A',
+    'humidity': 'N/A',
+    'wind_speed': 'N/A'
+}
+SPACE_FALLBACK = {'count': 'unknown', 'names': []}
+
+# The Harry Potter character list is effectively static, so it is cached
+# in-process and refreshed at most once per HP_CACHE_TTL_SECONDS.
+HP_CACHE_TTL_SECONDS = 3600
+HP_CACHE_RETRY_SECONDS = 60
+# 'error'/'error_ts' remember the last failed fetch on a cold cache, so
+# requests within HP_CACHE_RETRY_SECONDS re-raise it instead of refetching.
+_HP_CACHE: Dict[str, Any] = {'ts': 0.0, 'data': None, 'error': None, 'error_ts': 0.0}
+_HP_CACHE_LOCK = threading.Lock()
+# Only these fields are used in the message, so only they are kept in the cache.
+_HP_FIELDS = ('name', 'house', 'patronus', 'actor')
+
+# OpenWeather current data only updates about every 10 minutes, so results
+# are memoized per (city, country_code, units) for that long.
+_WEATHER_CACHE: TTLCache = TTLCache(maxsize=32, ttl=600)
+_WEATHER_CACHE_LOCK = threading.Lock()
+
 # ---------------------- Helper Functions ------------------------
-def fetch_random_hp_character() -> Dict[str, Any]:
+def _fetch_hp_characters() -> List[Dict[str, Any]]:
     """
-    Call the Harry Potter API and return a random character.
+    Download the Harry Potter character list, trimmed to the fields in _HP_FIELDS.
     API: https://hp-api.onrender.com/api/characters
-    Returns a dictionary with selected fields for message formatting.
     """
     url = "https://hp-api.onrender.com/api/characters"
-    response = requests.get(url, timeout=20)
+    response = SESSION.get(url, timeout=API_TIMEOUT)
     response.raise_for_status()
-    characters = response.json()
+    characters = orjson.loads(response.content)
 
     if not isinstance(characters, list) or len(characters) == 0:
         raise ValueError("Unexpected response from Harry Potter API.")
 
-    character = random.choice(characters)
+    characters = [
+        {field: character.get(field) for field in _HP_FIELDS}
+        for character in characters if isinstance(character, dict)
+    ]
+    if not characters:
+        raise ValueError("Unexpected response from Harry Potter API.")
+    return characters
+
+def _get_hp_characters() -> List[Dict[str, Any]]:
+    """
+    Return the Harry Potter character list, using the in-process cache.
+    If a refresh fails while a previous list is cached, the stale list is
+    served and the refresh is retried after HP_CACHE_RETRY_SECONDS.
+    If the first fetch fails, that error is re-raised for the next
+    HP_CACHE_RETRY_SECONDS, so requests queued on the lock fail at once
+    instead of each making its own slow fetch.
+    The lock ensures only one request refreshes an expired cache.
+    """
+    with _HP_CACHE_LOCK:
+        if _HP_CACHE['data'] is not None and time.monotonic() - _HP_CACHE['ts'] < HP_CACHE_TTL_SECONDS:
+            return _HP_CACHE['data']
+
+        recent_failure = (
+            _HP_CACHE['error'] is not None
+            and time.monotonic() - _HP_CACHE['error_ts'] < HP_CACHE_RETRY_SECONDS
+        )
+        if _HP_CACHE['data'] is None and recent_failure:
+            raise _HP_CACHE['error']
+
+        try:
+            characters = _fetch_hp_characters()
+        except Exception as exc:
+            # Cold cache: nothing to fall back on, so remember and surface the error.
+            if _HP_CACHE['data'] is None:
+                _HP_CACHE['error'] = exc
+                _HP_CACHE['error_ts'] = time.monotonic()
+                raise
+            # Otherwise keep serving the stale list and retry the refresh later.
+            append_json_log({
+                "timestamp": time.time(),
+                "error": f"Harry Potter API refresh failed, serving cached list: {exc}"
+            })
+            _HP_CACHE['ts'] = time.monotonic() - HP_CACHE_TTL_SECONDS + HP_CACHE_RETRY_SECONDS
+            return _HP_CACHE['data']
+
+        _HP_CACHE['data'] = characters
+        _HP_CACHE['ts'] = time.monotonic()
+        _HP_CACHE['error'] = None
+        return characters
+
+def fetch_random_hp_character() -> Dict[str, Any]:
+    """
+    Pick a random character from the (cached) Harry Potter API list.
+    Returns a dictionary with selected fields for message formatting.
+    """
+    character = random.choice(_get_hp_characters())
 
     # Extract safe fields with defaults to avoid KeyError/None in messages
     name = character.get('name') or 'Unknown Wizard'
@@ -82,12 +291,14 @@ def fetch_random_hp_character() -> Dict[str, Any]:
         'actor': actor
     }
 
+@cached(cache=_WEATHER_CACHE, lock=_WEATHER_CACHE_LOCK)
 def fetch_weather_summary(city: str, country_code: str, units: str) -> Dict[str, Any]:
     """
     Call OpenWeather "Current Weather" endpoint for the given city and return a tidy summary.
     Docs: https://openweathermap.org/current
     Requires: OPENWEATHER_API_KEY
 
+    Results are cached for 10 minutes per (city, country_code, units).
     Returns key weather fields for message formatting.
     """
     if not OPENWEATHER_API_KEY:
@@ -100,15 +311,20 @@ def fetch_weather_summary(city: str, country_code: str, units: str) -> Dict[str,
         "appid": OPENWEATHER_API_KEY,
         "units": units
     }
-    response = requests.get(url, params=params, timeout=20)
+    response = SESSION.get(url, params=params, timeout=API_TIMEOUT)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
-    description = (data.get('weather') or [{}])[0].get('description', 'no description')
-    temp = data.get('main', {}).get('temp')
-    feels_like = data.get('main', {}).get('feels_like')
-    humidity = data.get('main', {}).get('humidity')
-    wind_speed = data.get('wind', {}).get('speed')
+    # Look up each nested section once
+    main = data.get('main') or {}
+    wind = data.get('wind') or {}
+    weather_list = data.get('weather') or [{}]
+
+    description = weather_list[0].get('description', 'no description')
+    temp = main.get('temp')
+    feels_like = main.get('feels_like')
+    humidity = main.get('humidity')
+    wind_speed = wind.get('speed')
 
     return {
         'city': city,
@@ -128,9 +344,9 @@ def fetch_astronauts_in_space() -> Dict[str, Any]:
     Returns count and a list of names for message formatting.
     """
     url = "http://api.open-notify.org/astros.json"
-    response = requests.get(url, timeout=20)
+    response = SESSION.get(url, timeout=API_TIMEOUT)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     if data.get('message') != 'success':
         raise ValueError("OpenNotify did not return success.")
@@ -149,33 +365,23 @@ def format_message(hp: Dict[str, Any], weather: Dict[str, Any], space: Dict[str,
       "Weather in Toronto: 12°C, clear sky. Fun fact: Hermione Granger (Gryffindor, Patronus: Otter).
        There are 7 people in space right now: ..."
     """
-    # Build weather part with units label
-    if weather['units'] == 'metric':
-        temp_unit = '°C'
-        wind_unit = 'm/s'
-    else:
-        temp_unit = '°F'
-        wind_unit = 'mph'
-
-    weather_part = (
-        f"Weather in {weather['city']}: {weather['temp']}{temp_unit}, "
-        f"feels like {weather['feels_like']}{temp_unit}, "
-        f"{weather['description']}, humidity {weather['humidity']}%, "
-        f"wind {weather['wind_speed']} {wind_unit}."
-    )
-
-    hp_part = (
-        f" Wizarding note: {hp['name']} (House: {hp['house']}, Patronus: {hp['patronus']})."
-    )
-
     # Include up to first 5 astronaut names to keep message concise
-    astronaut_names = ', '.join(space['names'][:5]) if space['names'] else 'N/A'
-    space_part = (
-        f" People in space right now: {space['count']}"
-        + (f" ({astronaut_names})" if astronaut_names != 'N/A' else "") + "."
-    )
-
-    return f"{weather_part}{hp_part}{space_part}"
+    names = space.get('names') or ()
+    astro_suffix = f" ({', '.join(names[:5])})" if names else ""
+
+    return _MSG_TEMPLATE.format_map({
+        'city': weather['city'],
+        'temp': weather['temp'],
+        'feels_like': weather['feels_like'],
+        'description': weather['description'],
+        'humidity': weather['humidity'],
+        'wind_speed': weather['wind_speed'],
+        'name': hp['name'],
+        'house': hp['house'],
+        'patronus': hp['patronus'],
+        'count': space['count'],
+        'astro_suffix': astro_suffix
+    })
 
 def send_sms_via_twilio(body_text: str) -> Dict[str, Any]:
     """
@@ -185,11 +391,10 @@ def send_sms_via_twilio(body_text: str) -> Dict[str, Any]:
       - TWILIO_TO_NUMBER (Your verified recipient on trial)
     Returns a small dict with status and sid for logging.
     """
-    if not all([TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_FROM_NUMBER, TWILIO_TO_NUMBER]):
+    if not _TWILIO_READY:
         raise RuntimeError("Twilio configuration is incomplete. Set all required env variables.")
 
-    client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
-    msg = client.messages.create(
+    msg = TWILIO_CLIENT.messages.create(
         body=body_text,
         from_=TWILIO_FROM_NUMBER,
         to=TWILIO_TO_NUMBER
@@ -198,54 +403,134 @@ def send_sms_via_twilio(body_text: str) -> Dict[str, Any]:
 
 def append_json_log(record: Dict[str, Any]) -> None:
     """
-    Append a JSON record to logs/messages.log as a single JSON line (JSONL).
-    Creates the file if it does not exist.
+    Queue a JSON record for logs/messages.log as a single JSON line (JSONL).
+    The background log writer thread performs the actual buffered write.
+    Timestamps are recorded as Unix epoch seconds (time.time()).
     """
-    # Ensure logs directory exists.
-    os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
-    with open(LOG_FILE_PATH, 'a', encoding='utf-8') as log_file:
-        log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+    LOG_QUEUE.put(orjson.dumps(record, option=_ORJSON_LOG_OPTIONS))
+
+def _is_api_timeout(exc: BaseException) -> bool:
+    """
+    True if exc is a request timeout. A read timeout while the response
+    body is being downloaded is raised by requests as a ConnectionError
+    wrapping urllib3's ReadTimeoutError, so that case counts too.
+    """
+    if isinstance(exc, requests.Timeout):
+        return True
+    if isinstance(exc, requests.ConnectionError):
+        return (
+            any(isinstance(arg, ReadTimeoutError) for arg in exc.args)
+            or isinstance(exc.__cause__, ReadTimeoutError)
+            or isinstance(exc.__context__, ReadTimeoutError)
+        )
+    return False
+
+def _result_or_fallback(
+    future: "Future[Dict[str, Any]]", fallback: Dict[str, Any]
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Return (data, timed_out): the fetcher's result, or the given placeholder
+    if the API timed out. Timeouts are logged; any other error is re-raised
+    to abort the send.
+    """
+    try:
+        return future.result(), False
+    except requests.RequestException as exc:
+        if not _is_api_timeout(exc):
+            raise
+        append_json_log({
+            "timestamp": time.time(),
+            "error": f"API timeout, using placeholder data: {exc}"
+        })
+        return fallback, True
+
+def _send_and_log(message_text: str, city: str, country_code: str) -> None:
+    """
+    Send the SMS via Twilio and append the outcome to the JSON log.
+    Runs on SMS_EXECUTOR, so errors are logged here rather than flashed.
+    """
+    try:
+        twilio_result = send_sms_via_twilio(message_text)
+
+        # Create a structured log record
+        log_record = {
+            "timestamp": time.time(),
+            "message": message_text,
+            "twilio_sid": twilio_result.get("sid"),
+            "twilio_status": twilio_result.get("status"),
+            "weather_city": city,
+            "weather_country_code": country_code
+        }
+        append_json_log(log_record)
+
+    except Exception as exc:
+        # Log error details for troubleshooting
+        error_record = {
+            "timestamp": time.time(),
+            "message": message_text,
+            "error": str(exc)
+        }
+        append_json_log(error_record)
 
 # --------------------------- Routes -----------------------------
+# The index page is a single static template, so it is loaded and compiled
+# once here instead of being looked up (and stat'ed) on every GET.
+# Auto-reload is only turned off outside debug mode (FLASK_DEBUG=1), so
+# template edits are still picked up during development.
+if not app.debug:
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+with app.app_context():
+    _INDEX_TEMPLATE = app.jinja_env.get_template('index.html')
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     """
     GET: Render a page with one button ("Send Message").
     POST: On button press, call the three APIs, construct the message,
-          send it via Twilio, flash a success message, and log the result.
+          queue it for sending via Twilio (logged in the background),
+          and flash a confirmation message.
     """
     if request.method == 'POST':
         try:
-            # Call the three external APIs
-            hp = fetch_random_hp_character()
-            weather = fetch_weather_summary(WEATHER_CITY, WEATHER_COUNTRY_CODE, WEATHER_UNITS)
-            space = fetch_astronauts_in_space()
+            # Fail fast (and visibly) if Twilio is not configured; only the
+            # network send itself is handed off to the background.
+            if not _TWILIO_READY:
+                raise RuntimeError("Twilio configuration is incomplete. Set all required env variables.")
+
+            # Call the three external APIs concurrently
+            hp_future = FETCH_EXECUTOR.submit(fetch_random_hp_character)
+            weather_future = FETCH_EXECUTOR.submit(
+                fetch_weather_summary, WEATHER_CITY, WEATHER_COUNTRY_CODE, WEATHER_UNITS
+            )
+            space_future = FETCH_EXECUTOR.submit(fetch_astronauts_in_space)
+            hp, hp_timed_out = _result_or_fallback(hp_future, HP_FALLBACK)
+            weather, weather_timed_out = _result_or_fallback(weather_future, {
+                'city': WEATHER_CITY,
+                'country_code': WEATHER_COUNTRY_CODE,
+                'units': WEATHER_UNITS,
+                **WEATHER_FALLBACK
+            })
+            space, space_timed_out = _result_or_fallback(space_future, SPACE_FALLBACK)
+
+            # A partial message is fine, but one made only of placeholders is not
+            if hp_timed_out and weather_timed_out and space_timed_out:
+                raise RuntimeError("All external APIs timed out; no message to send.")
 
             # Build the SMS body
             message_text = format_message(hp, weather, space)
 
-            # Send it via Twilio
-            twilio_result = send_sms_via_twilio(message_text)
-
-            # Create a structured log record
-            log_record = {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "message": message_text,
-                "twilio_sid": twilio_result.get("sid"),
-                "twilio_status": twilio_result.get("status"),
-                "weather_city": WEATHER_CITY,
-                "weather_country_code": WEATHER_COUNTRY_CODE
-            }
-            append_json_log(log_record)
+            # Send it via Twilio and log the result in the background
+            SMS_EXECUTOR.submit(_send_and_log, message_text, WEATHER_CITY, WEATHER_COUNTRY_CODE)
 
-            # Flash success info to the user
-            flash("SMS sent successfully! (SID: {})".format(twilio_result.get("sid")), "success")
+            # Let the user know the SMS is on its way
+            flash("SMS queued for sending!", "success")
             return redirect(url_for('index'))
 
         except Exception as exc:
             # Log error details for troubleshooting
             error_record = {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": time.time(),
                 "error": str(exc)
             }
             append_json_log(error_record)
@@ -253,12 +538,19 @@ def index():
             flash("Failed to send SMS: {}".format(str(exc)), "error")
             return redirect(url_for('index'))
 
-    # GET request renders the template with the Send button
-    return render_template('index.html')
+    # GET request renders the template with the Send button.
+    # In debug mode go through render_template so template edits are picked up.
+    if app.debug:
+        return render_template('index.html')
+    return _INDEX_TEMPLATE.render()
 
 if __name__ == '__main__':
-    # When running locally: python app.py
+    # When running locally: python app.py (Werkzeug dev server).
+    # In production, run under gunicorn instead, e.g.:
+    #   gunicorn -k gthread --workers 2 --threads 8 --keep-alive 5 app:app
     # For Replit, the web server will run on the assigned port.
     port = int(os.environ.get("PORT", 5000))
+    # Debug mode (reloader + debugger) is opt-in via FLASK_DEBUG=1.
+    debug = os.environ.get("FLASK_DEBUG", "0") == "1"
     # host='0.0.0.0' allows external access in hosted environments like Replit
-    app.run(host='0.0.0.0', port=port, debug=True)
+    app.run(host='0.0.0.0', port=port, debug=debug)